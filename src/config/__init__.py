@@ -1,3 +1,3 @@
-from .config import LeagueConfig
+from .config import LeagueConfig, SymmetryConfig
 
-__all__ = ["LeagueConfig"]
+__all__ = ["LeagueConfig", "SymmetryConfig"]
@@ -28,7 +28,7 @@ class LeagueConfig:
     )
     time_slots: Set[str] = field(init=False)
     primetime_slots: Set[str] = field(
-        default_factory=lambda: {"Thursday Night" "Sunday Night", "Monday Night"}
+        default_factory=lambda: {"Thursday Night", "Sunday Night", "Monday Night"}
     )
     max_primetime_slots: int = 6
 
@@ -56,13 +56,17 @@ class LeagueConfig:
         }
     )
     region_matchups: Set[Tuple[str, str]] = field(
-        default_factory=lambda: {("North, South"), ("East", "West")}
+        default_factory=lambda: {("North", "South"), ("East", "West")}
     )
 
     # Division Info
-    division_conferences = field(init=False)
-    other_div_other_conf_matchups: Dict[str, str] = field(init=False)  # Team -> Conf
-    other_div_same_conf_matchups: Dict[str, str] = field(init=False)  # Team -> Conf
+    division_conferences: Dict[str, str] = field(init=False)
+    other_div_other_conf_matchups: Dict[str, Set[str]] = field(
+        init=False
+    )  # Team -> Teams
+    other_div_same_conf_matchups: Dict[str, Set[str]] = field(
+        init=False
+    )  # Team -> Teams
     division_teams: Dict[str, Set[str]] = field(
         default_factory=lambda: {
             "NFC North": {"Packers", "Lions", "Vikings", "Bears"},
@@ -80,6 +84,7 @@ class LeagueConfig:
     all_teams: Set[str] = field(init=False)
     team_divisions: Dict[str, str] = field(init=False)
     team_conferences: Dict[str, str] = field(init=False)
+    conference_teams: Dict[str, Set[str]] = field(init=False)
     team_elos: Dict[str, float] = field(
         default_factory=lambda: {
             "Eagles": 1629,
@@ -139,6 +144,12 @@ class LeagueConfig:
             for div in self.conference_divisions[conf]
             for team in self.division_teams[div]
         }
+        self.conference_teams = {
+            conf: set.union(
+                *(self.division_teams[div] for div in self.conference_divisions[conf])
+            )
+            for conf in self.conference_divisions
+        }
 
         self.other_div_other_conf_matchups = {}
         self.other_div_same_conf_matchups = {}
@@ -152,8 +163,22 @@ class LeagueConfig:
                     else:
                         map_to_add = self.other_div_other_conf_matchups
 
-                    for t1 in d1:
-                        map_to_add[t1] = d2
+                    for t1 in self.division_teams[d1]:
+                        map_to_add[t1] = self.division_teams[d2]
+
+                    for t2 in self.division_teams[d2]:
+                        map_to_add[t2] = self.division_teams[d1]
+
+
+@dataclass
+class SymmetryConfig:
+    """Toggles families of symmetry-breaking constraints. Each family only cuts
+    off schedules that are equivalent to one that is kept, so the optimal objective
+    is unchanged. Whether the smaller search space speeds up a given solver should
+    be checked with example/benchmark_symmetry.py."""
+
+    # Alphabetically first division rival hosts the earlier of the two games
+    division_game_orientation: bool = False
 
-                    for t2 in d2:
-                        map_to_add[t2] = d1
+    # Order interchangeable time slots (same max games and primetime status) in each week
+    slot_ordering: bool = False
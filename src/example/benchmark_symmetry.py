@@ -0,0 +1,110 @@
+"""This is a small script comparing solve times with and without each
+family of symmetry-breaking constraints. It reports how many constraints
+each family adds, and checks that every run reaches the same optimal
+objective as the run without symmetry breaking.
+
+By default it solves a 16-team league with CBC, which ships with pulp, so
+no commercial licence is needed. Pass --solver gurobi and --league nfl
+for the full-size problem."""
+
+import argparse
+import math
+import time
+
+import pulp as pl
+
+from config import LeagueConfig, SymmetryConfig
+from model import NFLScheduler
+
+SEEDS = [1, 2, 3]
+
+
+def small_league() -> LeagueConfig:
+    """Same structure as the NFL, with 2 teams per division over 10 weeks."""
+    return LeagueConfig(
+        num_weeks=10,
+        time_slot_max_games={
+            "Thursday Night": 1,
+            "Sunday": None,
+            "Sunday Night": 1,
+            "Monday Night": 1,
+        },
+        primetime_slots={"Thursday Night", "Sunday Night", "Monday Night"},
+        max_primetime_slots=5,
+        min_bye=3,
+        max_bye=6,
+        division_teams={
+            "NFC North": {"Packers", "Lions"},
+            "NFC East": {"Eagles", "Cowboys"},
+            "NFC South": {"Buccaneers", "Saints"},
+            "NFC West": {"Rams", "Seahawks"},
+            "AFC North": {"Ravens", "Browns"},
+            "AFC East": {"Bills", "Jets"},
+            "AFC South": {"Texans", "Titans"},
+            "AFC West": {"Chiefs", "Raiders"},
+        },
+    )
+
+
+def get_solver(name: str, seed: int):
+    """A solver that has to prove optimality, i.e. with no gap."""
+    if name == "gurobi":
+        return pl.GUROBI(msg=False, Symmetry=2, MIPGap=0, Seed=seed, timeLimit=6000)
+
+    return pl.PULP_CBC_CMD(
+        msg=False, gapRel=0, timeLimit=6000, options=[f"randomCbcSeed {seed}"]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--solver", choices=["cbc", "gurobi"], default="cbc")
+    parser.add_argument("--league", choices=["small", "nfl"], default="small")
+    args = parser.parse_args()
+
+    conf = small_league() if args.league == "small" else LeagueConfig()
+
+    runs = {
+        "none": SymmetryConfig(),
+        "division_game_orientation": SymmetryConfig(division_game_orientation=True),
+        "slot_ordering": SymmetryConfig(slot_ordering=True),
+        "all": SymmetryConfig(division_game_orientation=True, slot_ordering=True),
+    }
+
+    # Size of each family, no solver needed
+    base_constraints = len(NFLScheduler(conf).problem.constraints)
+    for name, symmetry_config in runs.items():
+        scheduler = NFLScheduler(conf, symmetry_config)
+        added = len(scheduler.problem.constraints) - base_constraints
+        print(f"{name}: {added} symmetry-breaking constraints")
+
+    base_objective = None
+    for name, symmetry_config in runs.items():
+        for seed in SEEDS:
+            scheduler = NFLScheduler(conf, symmetry_config)
+
+            # Only time the MIP, not building the schedule dataframe
+            start = time.perf_counter()
+            scheduler.problem.solve(get_solver(args.solver, seed))
+            elapsed = time.perf_counter() - start
+
+            status = pl.LpStatus[scheduler.problem.status]
+            objective = pl.value(scheduler.problem.objective)
+            print(
+                f"{name} (seed {seed}): {elapsed:.1f}s, "
+                f"objective {objective}, status {status}"
+            )
+
+            if status != "Optimal":
+                print(f"  NOT OPTIMAL: status {status}, objectives not compared")
+            elif base_objective is None:
+                if name != "none":
+                    print("  NO BASELINE: no optimal run without symmetry breaking")
+                else:
+                    base_objective = objective
+            elif not math.isclose(objective, base_objective, abs_tol=1e-6):
+                print(f"  MISMATCH: expected optimal objective {base_objective}")
+
+
+if __name__ == "__main__":
+    main()
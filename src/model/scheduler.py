@@ -1,11 +1,12 @@
 """For code to solve the NFL scheduling problem."""
 
 import math
+from typing import Optional
 
 import pandas as pd
 import pulp as pl
 
-from config import LeagueConfig
+from config import LeagueConfig, SymmetryConfig
 
 
 class NFLScheduler:
@@ -15,12 +16,18 @@ class NFLScheduler:
     of schedule.
     """
 
-    def __init__(self, league_config: LeagueConfig = LeagueConfig):
+    def __init__(
+        self,
+        league_config: Optional[LeagueConfig] = None,
+        symmetry_config: Optional[SymmetryConfig] = None,
+    ):
         """
-        Initializes an NFLScheduler with the given league settings.
+        Initializes an NFLScheduler with the given league settings and
+        symmetry-breaking settings.
         This will also build the LP problem into the attribute 'problem'.
         """
-        self.self.league_config = league_config
+        self.league_config = league_config or LeagueConfig()
+        self.symmetry_config = symmetry_config or SymmetryConfig()
         self._gen_problem()
 
     def _gen_problem(self) -> None:
@@ -41,8 +48,8 @@ class NFLScheduler:
         x = pl.LpVariable.dicts(
             "x",
             (
-                self.league_config.teams,
-                self.league_config.teams,
+                self.league_config.all_teams,
+                self.league_config.all_teams,
                 self.league_config.weeks,
                 self.league_config.time_slots,
             ),
@@ -53,7 +60,11 @@ class NFLScheduler:
 
         # Bye Week Variable Definition - Binary for a given week
         b = pl.LpVariable.dicts(
-            "b", (self.league_config.teams, self.league_config.weeks), 0, 1, pl.LpBinary
+            "b",
+            (self.league_config.all_teams, self.league_config.weeks),
+            0,
+            1,
+            pl.LpBinary,
         )
 
         ############ Constraints
@@ -62,7 +73,7 @@ class NFLScheduler:
         prob += (
             pl.lpSum(
                 x[team][team][w][s]
-                for team in self.league_config.teams
+                for team in self.league_config.all_teams
                 for w in self.league_config.weeks
                 for s in self.league_config.time_slots
             )
@@ -70,8 +81,10 @@ class NFLScheduler:
         )
 
         # Play home and away within division
-        for team in self.league_config.teams:
-            for conf_team in self.league_config.team_divisions[team] - {team}:
+        for team in self.league_config.all_teams:
+            for conf_team in self.league_config.division_teams[
+                self.league_config.team_divisions[team]
+            ] - {team}:
                 # They host the conference team
                 prob += (
                     pl.lpSum(
@@ -93,7 +106,7 @@ class NFLScheduler:
                 )
 
         # Play teams from a different conference and division
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             for other_conf_team in self.league_config.other_div_other_conf_matchups[
                 team
             ]:
@@ -107,9 +120,9 @@ class NFLScheduler:
                     == 1
                 )
 
-        ## 2 at home, 2 on the road
-        for team in self.league_config.teams:
-            # 2 home
+        ## Half at home, half on the road (2 and 2 for the NFL)
+        for team in self.league_config.all_teams:
+            # Half home
             prob += (
                 pl.lpSum(
                     x[team][other_conf_team][w][s]
@@ -119,10 +132,10 @@ class NFLScheduler:
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
                 )
-                == 2
+                == len(self.league_config.other_div_other_conf_matchups[team]) // 2
             )
 
-            # 2 away
+            # Half away
             prob += (
                 pl.lpSum(
                     x[other_conf_team][team][w][s]
@@ -132,11 +145,11 @@ class NFLScheduler:
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
                 )
-                == 2
+                == len(self.league_config.other_div_other_conf_matchups[team]) // 2
             )
 
         # Play teams from another conference in the same division
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             for other_conf_team in self.league_config.other_div_same_conf_matchups[
                 team
             ]:
@@ -150,9 +163,9 @@ class NFLScheduler:
                     == 1
                 )
 
-        ## 2 at home, 2 on the road
-        for team in self.league_config.teams:
-            # 2 home
+        ## Half at home, half on the road (2 and 2 for the NFL)
+        for team in self.league_config.all_teams:
+            # Half home
             prob += (
                 pl.lpSum(
                     x[team][other_conf_team][w][s]
@@ -162,10 +175,10 @@ class NFLScheduler:
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
                 )
-                == 2
+                == len(self.league_config.other_div_same_conf_matchups[team]) // 2
             )
 
-            # 2 away
+            # Half away
             prob += (
                 pl.lpSum(
                     x[other_conf_team][team][w][s]
@@ -175,14 +188,18 @@ class NFLScheduler:
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
                 )
-                == 2
+                == len(self.league_config.other_div_same_conf_matchups[team]) // 2
             )
 
         #       2 Games against teams from either remaining conference within the division
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             for other_conf_team in (
-                self.league_config.team_divisions[team]
-                - self.league_config.team_conferences[team]
+                self.league_config.conference_teams[
+                    self.league_config.team_conferences[team]
+                ]
+                - self.league_config.division_teams[
+                    self.league_config.team_divisions[team]
+                ]
                 - self.league_config.other_div_same_conf_matchups[team]
             ):
                 # They play the conference team either home or away ocne
@@ -196,13 +213,17 @@ class NFLScheduler:
                 )
 
         # exactly 1 home, 1 away
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             # 1 home
             prob += (
                 pl.lpSum(
                     x[team][other_conf_team][w][s]
-                    for other_conf_team in self.league_config.team_divisions[team]
-                    - self.league_config.team_conferences[team]
+                    for other_conf_team in self.league_config.conference_teams[
+                        self.league_config.team_conferences[team]
+                    ]
+                    - self.league_config.division_teams[
+                        self.league_config.team_divisions[team]
+                    ]
                     - self.league_config.other_div_same_conf_matchups[team]
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
@@ -214,8 +235,12 @@ class NFLScheduler:
             prob += (
                 pl.lpSum(
                     x[other_conf_team][team][w][s]
-                    for other_conf_team in self.league_config.team_divisions[team]
-                    - self.league_config.team_conferences[team]
+                    for other_conf_team in self.league_config.conference_teams[
+                        self.league_config.team_conferences[team]
+                    ]
+                    - self.league_config.division_teams[
+                        self.league_config.team_divisions[team]
+                    ]
                     - self.league_config.other_div_same_conf_matchups[team]
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
@@ -224,12 +249,14 @@ class NFLScheduler:
             )
 
         # 1 more game against a team from another division and conference
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += (
                 pl.lpSum(
                     x[team][other_team][w][s] + x[other_team][team][w][s]
-                    for other_team in self.league_config.teams
-                    - self.league_config.team_divisions[team]
+                    for other_team in self.league_config.all_teams
+                    - self.league_config.conference_teams[
+                        self.league_config.team_conferences[team]
+                    ]
                     - self.league_config.other_div_other_conf_matchups[team]
                     for w in self.league_config.weeks
                     for s in self.league_config.time_slots
@@ -238,9 +265,9 @@ class NFLScheduler:
             )
 
         # No repeated matchups
-        for team in self.league_config.teams:
-            for other_team in self.league_config.teams - {team}:
-                for week in self.league_config.weeks:
+        for team in self.league_config.all_teams:
+            for other_team in self.league_config.all_teams - {team}:
+                for week in self.league_config.weeks[:-1]:
                     prob += (
                         pl.lpSum(
                             x[team][other_team][week][s]
@@ -287,12 +314,12 @@ class NFLScheduler:
                     )
 
         # No more than max_primetime_slots primetime slots per team
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += (
                 pl.lpSum(
                     x[team][other_team][w][s] + x[other_team][team][w][s]
                     for w in self.league_config.weeks
-                    for other_team in self.league_config.teams
+                    for other_team in self.league_config.all_teams
                     for s in self.league_config.primetime_slots
                 )
                 <= self.league_config.max_primetime_slots
@@ -301,40 +328,39 @@ class NFLScheduler:
         # Number of Games per Time Slot
         #
         for week in self.league_config.weeks:
-            for time_slot, max_games in self.league_config.time_slot_max_games:
+            for time_slot, max_games in self.league_config.time_slot_max_games.items():
                 if max_games is None:
                     continue
 
-            # TNF
-            prob += (
-                pl.lpSum(
-                    x[home][away][week][time_slot]
-                    for home in self.league_config.teams
-                    for away in self.league_config.teams
+                prob += (
+                    pl.lpSum(
+                        x[home][away][week][time_slot]
+                        for home in self.league_config.all_teams
+                        for away in self.league_config.all_teams
+                    )
+                    == max_games
                 )
-                == max_games
-            )
 
         # SB Winner Must Play first game home
         prob += (
             pl.lpSum(
                 x[self.league_config.sb_winner][away][1][
-                    list(self.league_config.time_slots.values())[0]
+                    list(self.league_config.time_slot_max_games)[0]
                 ]
-                for away in self.league_config.teams
+                for away in self.league_config.all_teams
             )
             == 1
         )
 
         # byes_per_team Byes per team
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += (
                 pl.lpSum(b[team][w] for w in self.league_config.weeks)
                 == self.league_config.byes_per_team
             )
 
         # Bye week falls in valid range
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += (
                 pl.lpSum(b[team][w] for w in range(1, self.league_config.min_bye)) == 0
             )
@@ -352,58 +378,116 @@ class NFLScheduler:
 
         # Bye weeks evenly distributed for each week, i.e. for each eligible bye week, if k = len(teams) / (max_bye - min_bye + 1),
         # there are between floor(k) and ceil(k) teams on bye
-        k = len(self.league_config.teams) / (
+        k = len(self.league_config.all_teams) / (
             self.league_config.max_bye - self.league_config.min_bye + 1
         )
 
         for bye in range(self.league_config.min_bye, self.league_config.max_bye + 1):
             prob += pl.lpSum(
-                b[team][bye] for team in self.league_config.teams
+                b[team][bye] for team in self.league_config.all_teams
             ) >= math.floor(k)
             prob += pl.lpSum(
-                b[team][bye] for team in self.league_config.teams
+                b[team][bye] for team in self.league_config.all_teams
             ) <= math.ceil(k)
 
         # Team must be either on bye, home, or away
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             for week in self.league_config.weeks:
                 prob += (
                     pl.lpSum(
                         x[team][other_team][week][s] + x[other_team][team][week][s]
-                        for other_team in self.league_config.teams
+                        for other_team in self.league_config.all_teams
                         for s in self.league_config.time_slots
                     )
                     + b[team][week]
                     == 1
                 )
 
+        ############# Symmetry Breaking (optional)
+
+        # None of these constraints remove an optimal objective value: each family only
+        # picks one representative out of a set of equivalent schedules. They are
+        # compatible with each other since swapping slots within a week leaves the
+        # week and orientation of every game untouched.
+
+        # The home and away games between two division rivals can be mirrored, so the
+        # alphabetically first team hosts the earlier game. Skipped for the SB winner,
+        # since mirroring could move its week 1 home game on the road.
+        if self.symmetry_config.division_game_orientation:
+            for div_teams in self.league_config.division_teams.values():
+                rivals = sorted(div_teams - {self.league_config.sb_winner})
+                for i, team in enumerate(rivals):
+                    for div_team in rivals[i + 1 :]:
+                        prob += pl.lpSum(
+                            w * x[team][div_team][w][s]
+                            for w in self.league_config.weeks
+                            for s in self.league_config.time_slots
+                        ) <= pl.lpSum(
+                            w * x[div_team][team][w][s]
+                            for w in self.league_config.weeks
+                            for s in self.league_config.time_slots
+                        )
+
+        # Slots with the same game count and primetime status are interchangeable within
+        # a week, so order their games by home team. The first slot is not swapped in
+        # week 1, since the SB winner must play in it.
+        if self.symmetry_config.slot_ordering:
+            first_slot = list(self.league_config.time_slot_max_games)[0]
+            team_index = {
+                team: i for i, team in enumerate(sorted(self.league_config.all_teams))
+            }
+
+            for week in self.league_config.weeks:
+                slot_groups = {}
+                for (
+                    time_slot,
+                    max_games,
+                ) in self.league_config.time_slot_max_games.items():
+                    if week == 1 and time_slot == first_slot:
+                        continue
+                    slot_groups.setdefault(
+                        (max_games, time_slot in self.league_config.primetime_slots), []
+                    ).append(time_slot)
+
+                for group in slot_groups.values():
+                    for time_slot, next_slot in zip(group, group[1:]):
+                        prob += pl.lpSum(
+                            team_index[home] * x[home][away][week][time_slot]
+                            for home in self.league_config.all_teams
+                            for away in self.league_config.all_teams
+                        ) <= pl.lpSum(
+                            team_index[home] * x[home][away][week][next_slot]
+                            for home in self.league_config.all_teams
+                            for away in self.league_config.all_teams
+                        )
+
         ############# Objective Function
 
         # Balance team schedules - minimized maximum difference in total opponent rankings from mean
         d = pl.LpVariable("d")  # the max difference in total oppponent rankings
 
         # Abstract away SOS calculation into variables
-        s = pl.LpVariable.dicts("s", (self.league_config.teams))
+        s = pl.LpVariable.dicts("s", (self.league_config.all_teams))
 
         s_hat = pl.LpVariable("s_hat")
 
         # Calculate team SOS's once
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += s[team] == pl.lpSum(
-                self.league_config.ratings_map[o] * x[team][o][w][s]
-                + self.league_config.ratings_map[o] * x[o][team][w][s]
-                for o in self.league_config.teams
+                self.league_config.team_elos[o] * x[team][o][w][s]
+                + self.league_config.team_elos[o] * x[o][team][w][s]
+                for o in self.league_config.all_teams
                 for w in self.league_config.weeks
                 for s in self.league_config.time_slots
             )
 
         # Calculare mean SOS once
-        prob += s_hat == (1 / len(self.league_config.teams)) * pl.lpSum(
-            s[t] for t in self.league_config.teams
+        prob += s_hat == (1 / len(self.league_config.all_teams)) * pl.lpSum(
+            s[t] for t in self.league_config.all_teams
         )
 
         # d >= s_i - s_hat, i.e. it's the max difference
-        for team in self.league_config.teams:
+        for team in self.league_config.all_teams:
             prob += d >= s[team] - s_hat
             prob += d >= -(s[team] - s_hat)
 
@@ -413,6 +497,12 @@ class NFLScheduler:
         self._x = x
         self._b = b
 
+    @property
+    def problem(self) -> pl.LpProblem:
+        """The Pulp LP Problem built from the league config, e.g. to inspect its
+        constraints, or its status and objective value after solving."""
+        return self._problem
+
     def solve(self, solver) -> pd.DataFrame:
         """
         Solves the problem with the given solver, returning the produced
@@ -423,19 +513,19 @@ class NFLScheduler:
 
         # Get schedule for each team - output pandas dataframe with each week as a column and each team as a row.
         week_to_matchup = {
-            wk: ["BYE"] * len(self.league_config.teams)
+            wk: ["BYE"] * len(self.league_config.all_teams)
             for wk in self.league_config.weeks
         }  # Pre-fill with byes; replace with the matchups
 
-        for week in self.self.league_config.weeks:
-            for i, team in enumerate(self.self.league_config.teams):
+        for week in self.league_config.weeks:
+            for i, team in enumerate(self.league_config.all_teams):
                 if self._b[team][week].value() == 1:  # Bye?
                     continue  # already filled with bye
                 else:
                     # Otherwise, they must be playing a game
-                    for other_team in self.self.league_config.teams:
+                    for other_team in self.league_config.all_teams:
                         found = False  # To break multiple fors once found
-                        for slot in self.self.league_config.time_slots:
+                        for slot in self.league_config.time_slots:
                             if self._x[team][other_team][week][slot].value() == 1:
                                 week_to_matchup[week][i] = f"{slot} vs {other_team}"
                                 found = True
@@ -450,6 +540,6 @@ class NFLScheduler:
                             break
 
         schedule_df = pd.DataFrame(week_to_matchup)
-        schedule_df.insert(0, "Team", list(self.league_config.teams))
+        schedule_df.insert(0, "Team", list(self.league_config.all_teams))
         schedule_df = schedule_df.set_index("Team")
         return schedule_df